@@ -29,6 +29,15 @@ class Settings(BaseSettings):
     KUBECONFIG_PATH: Optional[str] = None  # Uses default ~/.kube/config if None
     CLUSTER_POLL_INTERVAL_SECONDS: int = 30
     MAX_CONCURRENT_CLUSTER_SCANS: int = 5
+    K8S_CONNECTION_POOL_MAXSIZE: int = 32
+    K8S_LIST_PAGE_SIZE: int = 500
+    K8S_STREAM_PARSE_THRESHOLD_BYTES: int = 1024 * 1024
+    K8S_API_MAX_RETRIES: int = 3
+    K8S_REQUEST_TIMEOUT_SECONDS: int = 30
+    HEALTH_CHECK_TIMEOUT_SECONDS: int = 45
+    API_SERVER_PROBE_TIMEOUT_SECONDS: float = 2.0
+    CONTROL_PLANE_WATCH_TIMEOUT_SECONDS: int = 60
+    CONTROL_PLANE_CACHE_MAX_AGE_SECONDS: int = 180
     
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
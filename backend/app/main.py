@@ -112,10 +112,12 @@ async def websocket_endpoint(websocket: WebSocket, cluster_id: int):
 async def broadcast_to_cluster(cluster_id: int, message: dict):
     """Broadcast message to all WebSocket clients for a cluster."""
     if cluster_id in active_connections:
+        # Serialize once and reuse the payload for every client
+        payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
         disconnected = []
         for connection in active_connections[cluster_id]:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except:
                 disconnected.append(connection)
         
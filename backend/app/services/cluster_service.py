@@ -1,22 +1,325 @@
 """Service for Kubernetes cluster operations."""
 
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from kubernetes import client, config
+import random
+import re
+import ssl
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Any
+from datetime import datetime
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+import httpx
+import ijson
 import logging
-
-try:
-    from openshift.dynamic import DynamicClient
-    HAS_OPENSHIFT = True
-except ImportError:
-    HAS_OPENSHIFT = False
+import orjson
 
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Namespaces hosting control-plane components (upstream and OpenShift)
+CONTROL_PLANE_NAMESPACES = frozenset({
+    "kube-system",
+    "openshift-etcd",
+    "openshift-kube-apiserver",
+    "openshift-kube-controller-manager",
+    "openshift-kube-scheduler",
+})
+# Name fragments identifying control-plane component pods
+CONTROL_PLANE_COMPONENT_RE = re.compile(r"etcd|apiserver|controller-manager|scheduler")
+# Label selectors matching control-plane pods, so the API server does the filtering
+CONTROL_PLANE_LABEL_SELECTORS = {
+    "kubernetes": "tier=control-plane",
+    "openshift": "app in (etcd,openshift-kube-apiserver,kube-controller-manager,openshift-kube-scheduler)",
+}
+
+# Accept header requesting a meta.k8s.io/v1 Table rendering of a LIST
+TABLE_ACCEPT = "application/json;as=Table;v=v1;g=meta.k8s.io"
+# Throttling and transient server errors worth retrying; other 4xx won't change on retry
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _call_with_backoff(fn, **kwargs):
+    """Call a Kubernetes API method, retrying throttling and server errors with jittered backoff.
+
+    Honours Retry-After; each attempt is bounded by K8S_REQUEST_TIMEOUT_SECONDS unless overridden.
+    """
+    kwargs.setdefault("_request_timeout", settings.K8S_REQUEST_TIMEOUT_SECONDS)
+    for attempt in range(settings.K8S_API_MAX_RETRIES + 1):
+        try:
+            return fn(**kwargs)
+        except ApiException as e:
+            if e.status not in RETRYABLE_STATUSES or attempt == settings.K8S_API_MAX_RETRIES:
+                raise
+            retry_after = (e.headers or {}).get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                delay = min(30, int(retry_after))
+            else:
+                delay = min(30, 2 ** attempt + random.uniform(0, 1))
+            logger.warning(f"Kubernetes API returned {e.status}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def _load_dynamic_client_class():
+    """Import the OpenShift dynamic client, or return None when it isn't installed.
+
+    Slow to import, so callers run this in a worker thread.
+    """
+    try:
+        from openshift.dynamic import DynamicClient
+    except ImportError:
+        return None
+    return DynamicClient
+
+
+def _list_all(list_fn, **kwargs):
+    """Call a LIST method page by page and return one response with all items.
+
+    The first page reads from the watch cache (resourceVersion=0), which usually ignores limit.
+    """
+    first_page_kwargs = {"resource_version": "0", **kwargs}
+    response = _call_with_backoff(list_fn, limit=settings.K8S_LIST_PAGE_SIZE, **first_page_kwargs)
+    items = list(response.items)
+    
+    # Continue tokens already pin the snapshot, so resourceVersion must not be resent
+    while response.metadata._continue:
+        response = _call_with_backoff(
+            list_fn,
+            limit=settings.K8S_LIST_PAGE_SIZE,
+            _continue=response.metadata._continue,
+            **kwargs,
+        )
+        items.extend(response.items)
+    
+    response.items = items
+    return response
+
+
+def _list_table_rows(api_client: client.ApiClient, path: str) -> List[Dict[str, Any]]:
+    """LIST a resource's printer columns through the Table API, as dicts keyed by column name."""
+    response = _call_with_backoff(
+        api_client.call_api,
+        resource_path=path,
+        method="GET",
+        query_params=[("includeObject", "None")],
+        header_params={"Accept": TABLE_ACCEPT},
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+        _preload_content=False,
+    )
+    table = orjson.loads(response.data)
+    columns = [column["name"] for column in table.get("columnDefinitions") or []]
+    return [dict(zip(columns, row["cells"])) for row in table.get("rows") or []]
+
+
+class _PrefixedReader:
+    """File-like reader that replays an already-read prefix before the rest of a response."""
+
+    def __init__(self, prefix: bytes, response):
+        self._prefix = prefix
+        self._response = response
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        if self._prefix:
+            chunk, self._prefix = self._prefix, b""
+            return chunk
+        return self._response.read(size)
+
+
+def _stream_list_items(list_fn, **kwargs) -> Iterator[Dict[str, Any]]:
+    """Yield raw items from every page of a LIST without materializing large pages.
+
+    Pages whose decoded body fits in K8S_STREAM_PARSE_THRESHOLD_BYTES go through orjson; larger ones through ijson.
+    """
+    threshold = settings.K8S_STREAM_PARSE_THRESHOLD_BYTES
+    page_kwargs = dict(kwargs)
+    while True:
+        response = _call_with_backoff(
+            list_fn, limit=settings.K8S_LIST_PAGE_SIZE, _preload_content=False, **page_kwargs
+        )
+        continue_token = None
+        
+        def events(source):
+            nonlocal continue_token
+            for prefix, event, value in ijson.parse(source):
+                if prefix == "metadata.continue":
+                    continue_token = value
+                yield prefix, event, value
+        
+        try:
+            buffer = bytearray()
+            while len(buffer) <= threshold:
+                chunk = response.read(threshold + 1 - len(buffer))
+                if not chunk:
+                    body = orjson.loads(buffer)
+                    continue_token = (body.get("metadata") or {}).get("continue")
+                    yield from body.get("items") or []
+                    break
+                buffer += chunk
+            else:
+                yield from ijson.items(events(_PrefixedReader(bytes(buffer), response)), "items.item")
+        finally:
+            response.release_conn()
+        
+        if not continue_token:
+            return
+        page_kwargs = {"_continue": continue_token, **kwargs}
+
+
+def _list_pod_records(list_fn, **kwargs) -> List["PodRecord"]:
+    """Stream a pod LIST straight into records."""
+    return [PodRecord.from_dict(item) for item in _stream_list_items(list_fn, **kwargs)]
+
+
+@dataclass(slots=True)
+class PodRecord:
+    """The subset of a pod the service reports on."""
+    name: str
+    namespace: str
+    phase: Optional[str]
+    ready: bool
+    restart_count: int
+    creation_timestamp: Optional[datetime]
+    
+    @classmethod
+    def from_pod(cls, pod) -> "PodRecord":
+        """Project a V1Pod model onto a record."""
+        statuses = pod.status.container_statuses or []
+        return cls(
+            name=pod.metadata.name,
+            namespace=pod.metadata.namespace,
+            phase=pod.status.phase,
+            ready=bool(statuses) and all(cs.ready for cs in statuses),
+            restart_count=sum(cs.restart_count for cs in statuses),
+            creation_timestamp=pod.metadata.creation_timestamp,
+        )
+    
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "PodRecord":
+        """Project a raw pod JSON object onto a record."""
+        metadata = raw.get("metadata") or {}
+        status = raw.get("status") or {}
+        statuses = status.get("containerStatuses") or []
+        created = metadata.get("creationTimestamp")
+        return cls(
+            name=metadata.get("name"),
+            namespace=metadata.get("namespace"),
+            phase=status.get("phase"),
+            ready=bool(statuses) and all(cs.get("ready") for cs in statuses),
+            restart_count=sum(cs.get("restartCount", 0) for cs in statuses),
+            creation_timestamp=datetime.fromisoformat(created) if created else None,
+        )
+
+
+class ControlPlanePodWatcher:
+    """Keep a local copy of control-plane pods current via a background watch."""
+    
+    def __init__(self, v1: client.CoreV1Api, label_selector: str):
+        self._v1 = v1
+        self._label_selector = label_selector
+        self._pods: Dict[str, PodRecord] = {}
+        self._lock = threading.RLock()
+        self._resource_version: Optional[str] = None
+        self._last_synced: Optional[float] = None
+        self._stop = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """List current pods, then follow changes in a daemon thread."""
+        self._relist()
+        # The caller may have given up (and stopped us) while the LIST was in flight
+        if self._stop.is_set():
+            return
+        self._thread = threading.Thread(target=self._run, name="control-plane-pod-watch", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop following changes; the thread exits within one watch timeout."""
+        self._stop.set()
+        if self._watch is not None:
+            self._watch.stop()
+    
+    def snapshot(self) -> List[PodRecord]:
+        """Return the currently known control-plane pods."""
+        with self._lock:
+            return list(self._pods.values())
+    
+    def seconds_since_sync(self) -> Optional[float]:
+        """Seconds since the local copy was last confirmed current, or None if never."""
+        if self._last_synced is None:
+            return None
+        return time.monotonic() - self._last_synced
+    
+    @staticmethod
+    def _key(pod) -> str:
+        return f"{pod.metadata.namespace}/{pod.metadata.name}"
+    
+    def _relist(self):
+        """Replace the local copy with a fresh LIST and remember its resource version."""
+        pods = _list_all(self._v1.list_pod_for_all_namespaces, label_selector=self._label_selector)
+        with self._lock:
+            self._pods = {
+                self._key(pod): PodRecord.from_pod(pod)
+                for pod in pods.items
+                if pod.metadata.namespace in CONTROL_PLANE_NAMESPACES
+            }
+            self._resource_version = pods.metadata.resource_version
+            self._last_synced = time.monotonic()
+    
+    def _run(self):
+        """Apply watch events to the local copy until stopped."""
+        while not self._stop.is_set():
+            try:
+                self._watch = watch.Watch()
+                received = 0
+                for event in self._watch.stream(
+                    self._v1.list_pod_for_all_namespaces,
+                    label_selector=self._label_selector,
+                    resource_version=self._resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=settings.CONTROL_PLANE_WATCH_TIMEOUT_SECONDS,
+                ):
+                    received += 1
+                    pod = event["object"]
+                    self._resource_version = pod.metadata.resource_version
+                    self._last_synced = time.monotonic()
+                    # Bookmarks only carry a resource version and fail the namespace check
+                    if pod.metadata.namespace in CONTROL_PLANE_NAMESPACES:
+                        with self._lock:
+                            if event["type"] == "DELETED":
+                                self._pods.pop(self._key(pod), None)
+                            else:
+                                self._pods[self._key(pod)] = PodRecord.from_pod(pod)
+                    if self._stop.is_set():
+                        break
+                
+                # A watch that ends without a single event (not even a bookmark) may have
+                # been closed on an expired resource version, so resync from a LIST
+                if received:
+                    self._last_synced = time.monotonic()
+                elif not self._stop.is_set():
+                    self._relist()
+            except ApiException as e:
+                if e.status == 410:
+                    # Resource version expired, start over from a fresh LIST
+                    try:
+                        self._relist()
+                    except Exception as relist_error:
+                        logger.error(f"Failed to relist control-plane pods: {relist_error}")
+                        self._stop.wait(5)
+                else:
+                    logger.error(f"Control-plane pod watch failed: {e}")
+                    self._stop.wait(5)
+            except Exception as e:
+                logger.error(f"Control-plane pod watch failed: {e}")
+                self._stop.wait(5)
+
 
 class ClusterService:
     """Service for interacting with Kubernetes clusters."""
@@ -30,25 +333,38 @@ class ClusterService:
         async with self._lock:
             if cluster_id not in self.clients:
                 try:
-                    # Load kubeconfig (sync call, run in thread)
-                    if kubeconfig_path:
-                        await asyncio.to_thread(config.load_kube_config, config_file=kubeconfig_path)
-                    else:
-                        await asyncio.to_thread(config.load_kube_config)
+                    # Load kubeconfig into a per-cluster configuration (sync call, run in thread)
+                    # so clusters don't overwrite each other's global default config
+                    configuration = client.Configuration()
+                    await asyncio.to_thread(
+                        config.load_kube_config,
+                        config_file=kubeconfig_path or None,
+                        client_configuration=configuration,
+                    )
+                    # Size the urllib3 pool for concurrent checks so connections
+                    # (and their TLS sessions) are reused instead of discarded
+                    configuration.connection_pool_maxsize = settings.K8S_CONNECTION_POOL_MAXSIZE
                     
-                    # Create clients
-                    api_client = client.ApiClient()
+                    # Create clients sharing one connection pool
+                    api_client = client.ApiClient(configuration)
+                    # Let the API server gzip large LIST responses; urllib3 decodes them
+                    # transparently, so payload bytes shrink without changing callers
+                    api_client.set_default_header("Accept-Encoding", "gzip")
                     v1 = client.CoreV1Api(api_client)
                     apps_v1 = client.AppsV1Api(api_client)
                     
                     # Try OpenShift dynamic client
                     dynamic_client = None
+                    cluster_operators_resource = None
                     cluster_type = "kubernetes"
-                    if HAS_OPENSHIFT:
+                    DynamicClient = await asyncio.to_thread(_load_dynamic_client_class)
+                    if DynamicClient is not None:
                         try:
-                            dynamic_client = DynamicClient(api_client)
-                            # Test OpenShift-specific API
-                            await asyncio.to_thread(
+                            # Construction runs API discovery, so keep it off the event loop too
+                            dynamic_client = await asyncio.to_thread(DynamicClient, api_client)
+                            # Test OpenShift-specific API, keeping the resolved resource
+                            # so later calls skip discovery
+                            cluster_operators_resource = await asyncio.to_thread(
                                 dynamic_client.resources.get,
                                 api_version='config.openshift.io/v1',
                                 kind='ClusterOperator',
@@ -58,10 +374,14 @@ class ClusterService:
                             cluster_type = "kubernetes"
                     
                     self.clients[cluster_id] = {
+                        "api_client": api_client,
                         "v1": v1,
                         "apps_v1": apps_v1,
                         "dynamic": dynamic_client,
+                        "cluster_operators_resource": cluster_operators_resource,
                         "cluster_type": cluster_type,
+                        # Per-cluster, so a slow API server only delays its own watcher start
+                        "watch_lock": asyncio.Lock(),
                         "created_at": datetime.now(),
                     }
                     
@@ -89,34 +409,35 @@ class ClusterService:
         """Get all nodes in cluster."""
         try:
             v1 = cluster_client["v1"]
-            nodes = await asyncio.to_thread(v1.list_node)
+            nodes = await asyncio.to_thread(_list_all, v1.list_node)
             
-            return [
-                {
-                    "name": node.metadata.name,
-                    "status": self._get_node_status(node),
-                    "roles": self._get_node_roles(node),
-                    "version": node.status.node_info.kubelet_version,
-                    "cpu_capacity": self._parse_resource(node.status.capacity.get("cpu", "0")),
-                    "memory_capacity": self._parse_resource(node.status.capacity.get("memory", "0")),
-                    "conditions": [
-                        {
-                            "type": c.type,
-                            "status": c.status,
-                            "message": c.message if c.message else None,
-                        }
-                        for c in node.status.conditions
-                    ],
-                }
-                for node in nodes.items
-            ]
+            return [self._serialize_node(node) for node in nodes.items]
         except Exception as e:
             logger.error(f"Failed to get nodes: {e}")
             return []
     
+    def _serialize_node(self, node) -> Dict:
+        """Convert a node model into the API's node summary."""
+        return {
+            "name": node.metadata.name,
+            "status": self._get_node_status(node),
+            "roles": self._get_node_roles(node),
+            "version": node.status.node_info.kubelet_version,
+            "cpu_capacity": self._parse_resource(node.status.capacity.get("cpu", "0")),
+            "memory_capacity": self._parse_resource(node.status.capacity.get("memory", "0")),
+            "conditions": [
+                {
+                    "type": c.type,
+                    "status": c.status,
+                    "message": c.message if c.message else None,
+                }
+                for c in (node.status.conditions or ())
+            ],
+        }
+    
     def _get_node_status(self, node) -> str:
         """Determine node status from conditions."""
-        for condition in node.status.conditions:
+        for condition in (node.status.conditions or ()):
             if condition.type == "Ready":
                 return "Ready" if condition.status == "True" else "NotReady"
         return "Unknown"
@@ -169,32 +490,65 @@ class ClusterService:
             v1 = cluster_client["v1"]
             
             if namespace:
-                pods = await asyncio.to_thread(v1.list_namespaced_pod, namespace=namespace)
+                records = await asyncio.to_thread(_list_pod_records, v1.list_namespaced_pod, namespace=namespace)
             else:
-                pods = await asyncio.to_thread(v1.list_pod_for_all_namespaces)
+                records = await asyncio.to_thread(_list_pod_records, v1.list_pod_for_all_namespaces)
             
-            return [
-                {
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "status": pod.status.phase,
-                    "restart_count": sum(
-                        cs.restart_count for cs in (pod.status.container_statuses or [])
-                    ),
-                    "ready": self._is_pod_ready(pod),
-                    "age": self._calculate_age(pod.metadata.creation_timestamp),
-                }
-                for pod in pods.items
-            ]
+            return [self._serialize_pod(record) for record in records]
         except Exception as e:
             logger.error(f"Failed to get pods: {e}")
             return []
     
-    def _is_pod_ready(self, pod) -> bool:
-        """Check if pod is ready."""
-        if not pod.status.container_statuses:
-            return False
-        return all(cs.ready for cs in pod.status.container_statuses)
+    async def get_control_plane_pods(self, cluster_client: Dict[str, Any]) -> Dict[str, Any]:
+        """Get control-plane pods from the cluster's watch-backed pod cache.
+
+        Flagged stale once unconfirmed for CONTROL_PLANE_CACHE_MAX_AGE_SECONDS.
+        """
+        try:
+            async with cluster_client["watch_lock"]:
+                watcher = cluster_client.get("control_plane_watcher")
+                if watcher is None:
+                    label_selector = CONTROL_PLANE_LABEL_SELECTORS.get(
+                        cluster_client.get("cluster_type"), CONTROL_PLANE_LABEL_SELECTORS["kubernetes"]
+                    )
+                    watcher = ControlPlanePodWatcher(cluster_client["v1"], label_selector)
+                    try:
+                        await asyncio.to_thread(watcher.start)
+                    except BaseException:
+                        # Failed or cancelled: keep the worker thread from starting a watch
+                        watcher.stop()
+                        raise
+                    cluster_client["control_plane_watcher"] = watcher
+            
+            synced_seconds_ago = watcher.seconds_since_sync()
+            stale = (
+                synced_seconds_ago is None
+                or synced_seconds_ago > settings.CONTROL_PLANE_CACHE_MAX_AGE_SECONDS
+            )
+            if stale:
+                logger.warning(f"Control-plane pod cache is stale (last synced {synced_seconds_ago}s ago)")
+            
+            return {
+                "pods": self._filter_control_plane_pods(
+                    [self._serialize_pod(record) for record in watcher.snapshot()]
+                ),
+                "stale": stale,
+                "synced_seconds_ago": round(synced_seconds_ago, 1) if synced_seconds_ago is not None else None,
+            }
+        except Exception as e:
+            logger.error(f"Failed to get control-plane pods: {e}")
+            return {"pods": [], "stale": True, "synced_seconds_ago": None, "error": str(e)}
+    
+    def _serialize_pod(self, record: PodRecord) -> Dict:
+        """Convert a pod record into the API's pod summary."""
+        return {
+            "name": record.name,
+            "namespace": record.namespace,
+            "status": record.phase,
+            "restart_count": record.restart_count,
+            "ready": record.ready,
+            "age": self._calculate_age(record.creation_timestamp),
+        }
     
     def _calculate_age(self, creation_timestamp) -> str:
         """Calculate pod age."""
@@ -217,7 +571,7 @@ class ClusterService:
         """Get all namespaces."""
         try:
             v1 = cluster_client["v1"]
-            namespaces = await asyncio.to_thread(v1.list_namespace)
+            namespaces = await asyncio.to_thread(_list_all, v1.list_namespace)
             
             return [
                 {
@@ -233,42 +587,181 @@ class ClusterService:
     
     async def get_cluster_operators(self, cluster_client: Dict[str, Any]) -> List[Dict]:
         """Get OpenShift cluster operators."""
-        if cluster_client.get("cluster_type") != "openshift" or not cluster_client.get("dynamic"):
+        operators = cluster_client.get("cluster_operators_resource")
+        if cluster_client.get("cluster_type") != "openshift" or not operators:
             return []
         
         try:
-            dynamic = cluster_client["dynamic"]
-            operators = await asyncio.to_thread(
-                dynamic.resources.get,
-                api_version='config.openshift.io/v1',
-                kind='ClusterOperator',
-            )
-            operator_list = await asyncio.to_thread(operators.get)
+            # ClusterOperator printer columns already carry Available/Progressing/Degraded,
+            # so the Table view avoids transferring relatedObjects and versions
+            rows = await asyncio.to_thread(_list_table_rows, cluster_client["api_client"], operators.path())
             
-            return [
-                {
-                    "name": op.metadata.name,
-                    "available": self._check_operator_condition(op, "Available"),
-                    "progressing": self._check_operator_condition(op, "Progressing"),
-                    "degraded": self._check_operator_condition(op, "Degraded"),
-                }
-                for op in operator_list.items
-            ]
+            return [self._serialize_operator(row) for row in rows]
         except Exception as e:
             logger.error(f"Failed to get cluster operators: {e}")
             return []
     
-    def _check_operator_condition(self, operator, condition_type: str) -> bool:
-        """Check if operator has a specific condition."""
-        if not hasattr(operator, 'status') or not hasattr(operator.status, 'conditions'):
-            return False
+    def _serialize_operator(self, row: Dict[str, Any]) -> Dict:
+        """Convert a ClusterOperator table row into the API's operator summary."""
+        return {
+            "name": row.get("Name"),
+            "available": row.get("Available") == "True",
+            "progressing": row.get("Progressing") == "True",
+            "degraded": row.get("Degraded") == "True",
+        }
+
+    async def get_api_server_health(self, cluster_client: Dict[str, Any]) -> Dict[str, Any]:
+        """Probe /readyz on every API server instance behind the kubernetes service.
+
+        Only "not_ready" counts as unhealthy; "unknown" and "unreachable" mean the probe was inconclusive.
+        """
+        api_status = self._empty_api_status()
+        try:
+            v1 = cluster_client["v1"]
+            endpoints = await asyncio.to_thread(
+                v1.read_namespaced_endpoints,
+                "kubernetes",
+                "default",
+                _request_timeout=settings.K8S_REQUEST_TIMEOUT_SECONDS,
+            )
+            
+            urls = [
+                f"https://{self._format_host(address.ip)}:{port.port}/readyz"
+                for subset in (endpoints.subsets or [])
+                for address in (subset.addresses or [])
+                for port in (subset.ports or [])
+            ]
+            
+            configuration = cluster_client["api_client"].configuration
+            ssl_context = await asyncio.to_thread(self._build_probe_ssl_context, configuration)
+            # May run an exec/OIDC refresh hook, so keep it off the event loop
+            headers = await asyncio.to_thread(self._build_probe_headers, configuration)
+            async with httpx.AsyncClient(
+                verify=ssl_context,
+                headers=headers,
+                timeout=settings.API_SERVER_PROBE_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=16),
+            ) as http_client:
+                results = await asyncio.gather(*(self._probe_readyz(http_client, url) for url in urls))
+            
+            api_status["servers"] = results
+            api_status["total_servers"] = len(results)
+            api_status["healthy_servers"] = sum(result["status"] == "ready" for result in results)
+            api_status["unhealthy_servers"] = sum(result["status"] == "not_ready" for result in results)
+            api_status["unknown_servers"] = sum(result["status"] == "unknown" for result in results)
+            api_status["unreachable_servers"] = sum(result["status"] == "unreachable" for result in results)
+        except Exception as e:
+            logger.error(f"Failed to check API server health: {e}")
         
-        for condition in operator.status.conditions:
-            if condition.type == condition_type:
-                return condition.status == "True"
+        return api_status
+    
+    @staticmethod
+    def _empty_api_status() -> Dict[str, Any]:
+        return {
+            "total_servers": 0,
+            "healthy_servers": 0,
+            "unhealthy_servers": 0,
+            "unknown_servers": 0,
+            "unreachable_servers": 0,
+            "servers": [],
+        }
+    
+    def _build_probe_ssl_context(self, configuration: client.Configuration) -> ssl.SSLContext:
+        """Build a TLS context for probes from the cluster's client configuration.
+
+        Only the hostname check is disabled, as endpoints are addressed by IP.
+        """
+        context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        context.check_hostname = False
+        if not configuration.verify_ssl:
+            # The kubeconfig itself opts out of verification (insecure-skip-tls-verify)
+            context.verify_mode = ssl.CERT_NONE
+        if configuration.cert_file:
+            context.load_cert_chain(configuration.cert_file, configuration.key_file)
+        return context
+    
+    def _build_probe_headers(self, configuration: client.Configuration) -> Dict[str, str]:
+        """Send the cluster's bearer token with probes when it has one."""
+        authorization = configuration.get_api_key_with_prefix("authorization")
+        return {"Authorization": authorization} if authorization else {}
+    
+    async def _probe_readyz(self, http_client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+        """Probe a single API server readiness endpoint."""
+        try:
+            response = await http_client.get(url)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            if self._is_tls_error(e):
+                # Reachable, but the serving certificate was rejected
+                return {"endpoint": url, "status": "unknown", "error": str(e) or type(e).__name__}
+            return {"endpoint": url, "status": "unreachable", "error": str(e) or type(e).__name__}
+        except httpx.HTTPError as e:
+            # Connected but got no usable answer in time
+            return {"endpoint": url, "status": "not_ready", "error": str(e) or type(e).__name__}
         
+        if response.status_code == 200:
+            status = "ready"
+        elif response.status_code in (401, 403):
+            status = "unknown"
+        else:
+            status = "not_ready"
+        return {"endpoint": url, "status": status, "status_code": response.status_code}
+    
+    def _is_tls_error(self, error: BaseException) -> bool:
+        while error is not None:
+            if isinstance(error, ssl.SSLError):
+                return True
+            error = error.__cause__ or error.__context__
         return False
+    
+    def _format_host(self, ip: str) -> str:
+        """Bracket IPv6 addresses for use in a URL."""
+        return f"[{ip}]" if ":" in ip else ip
+    
+    def _filter_control_plane_pods(self, pods: List[Dict]) -> List[Dict]:
+        """Select control-plane component pods from a pod summary list."""
+        return [
+            pod for pod in pods
+            if pod["namespace"] in CONTROL_PLANE_NAMESPACES
+            and CONTROL_PLANE_COMPONENT_RE.search(pod["name"])
+        ]
 
+    async def get_health_report(self, cluster_client: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect nodes, pods, namespaces, operators and API server health concurrently.
+
+        A check that exceeds HEALTH_CHECK_TIMEOUT_SECONDS yields its empty value and is listed in "degraded_checks".
+        """
+        checks = {
+            "nodes": (self.get_nodes(cluster_client), []),
+            "pods": (self.get_pods_by_namespace(cluster_client), []),
+            "control_plane_pods": (
+                self.get_control_plane_pods(cluster_client),
+                {"pods": [], "stale": True, "synced_seconds_ago": None},
+            ),
+            "namespaces": (self.get_namespaces(cluster_client), []),
+            "cluster_operators": (self.get_cluster_operators(cluster_client), []),
+            "api_servers": (self.get_api_server_health(cluster_client), self._empty_api_status()),
+        }
+        degraded: List[str] = []
+        results = await asyncio.gather(
+            *(self._run_check(name, check, empty, degraded) for name, (check, empty) in checks.items())
+        )
+        
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "cluster_type": cluster_client.get("cluster_type"),
+            **dict(zip(checks, results)),
+            "degraded_checks": degraded,
+        }
+    
+    async def _run_check(self, name: str, check, empty: Any, degraded: List[str]) -> Any:
+        """Await a report check, falling back to its empty value if it times out."""
+        timeout = settings.HEALTH_CHECK_TIMEOUT_SECONDS
+        try:
+            return await asyncio.wait_for(check, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Health check '{name}' timed out after {timeout}s")
+            degraded.append(name)
+            return empty
 
 # Singleton instance
 cluster_service = ClusterService()
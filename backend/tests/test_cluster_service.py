@@ -0,0 +1,448 @@
+"""Tests for the cluster service's LIST, retry and watch helpers."""
+
+import asyncio
+import io
+import json
+import ssl
+
+import httpx
+import pytest
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from app.core.config import settings
+from app.services import cluster_service as cs
+
+
+class FakeResponse(io.BytesIO):
+    """Raw urllib3-style response returned when _preload_content=False."""
+
+    def __init__(self, body: dict):
+        super().__init__(json.dumps(body).encode())
+        self.released = False
+
+    @property
+    def data(self) -> bytes:
+        return self.getvalue()
+
+    def release_conn(self):
+        self.released = True
+
+
+class FakeList:
+    """LIST method returning scripted pages and recording its calls."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.pages.pop(0)
+
+
+def pod_json(name, namespace="default", ready=True, restarts=0):
+    return {
+        "metadata": {"name": name, "namespace": namespace, "creationTimestamp": "2024-01-01T00:00:00Z"},
+        "status": {
+            "phase": "Running",
+            "containerStatuses": [{"name": "main", "ready": ready, "restartCount": restarts}],
+        },
+    }
+
+
+def pod_model(name, namespace="openshift-etcd", ready=True, resource_version="1"):
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name=name, namespace=namespace, resource_version=resource_version),
+        status=client.V1PodStatus(
+            phase="Running",
+            container_statuses=[
+                client.V1ContainerStatus(
+                    name="main", ready=ready, restart_count=0, image="img", image_id="img-id"
+                )
+            ],
+        ),
+    )
+
+
+def pod_list(pods, resource_version="10"):
+    return client.V1PodList(items=pods, metadata=client.V1ListMeta(resource_version=resource_version))
+
+
+def api_exception(status, headers=None):
+    error = ApiException(status=status, reason="test")
+    error.headers = headers
+    return error
+
+
+# Streaming LIST
+
+def test_stream_list_items_follows_continue_token_via_ijson(monkeypatch):
+    monkeypatch.setattr(settings, "K8S_STREAM_PARSE_THRESHOLD_BYTES", 64)
+    monkeypatch.setattr(cs.orjson, "loads", pytest.fail)
+    list_fn = FakeList([
+        FakeResponse({"metadata": {"continue": "next-page"}, "items": [pod_json("a"), pod_json("b")]}),
+        FakeResponse({"metadata": {}, "items": [pod_json("c")]}),
+    ])
+
+    items = list(cs._stream_list_items(list_fn, namespace="default"))
+
+    assert [item["metadata"]["name"] for item in items] == ["a", "b", "c"]
+    assert list_fn.calls[0]["_preload_content"] is False
+    assert "_continue" not in list_fn.calls[0]
+    assert list_fn.calls[1]["_continue"] == "next-page"
+    assert all("resource_version" not in call for call in list_fn.calls)
+
+
+def test_stream_list_items_follows_continue_token_via_orjson(monkeypatch):
+    monkeypatch.setattr(cs.ijson, "items", pytest.fail)
+    first = FakeResponse({"metadata": {"continue": "next-page"}, "items": [pod_json("a")]})
+    second = FakeResponse({"metadata": {}, "items": [pod_json("b")]})
+    list_fn = FakeList([first, second])
+
+    items = list(cs._stream_list_items(list_fn))
+
+    assert [item["metadata"]["name"] for item in items] == ["a", "b"]
+    assert list_fn.calls[1]["_continue"] == "next-page"
+    assert first.released and second.released
+
+
+def test_pod_record_from_dict():
+    raw = pod_json("a", namespace="kube-system", ready=False, restarts=3)
+    raw["status"]["containerStatuses"].append({"name": "sidecar", "ready": True, "restartCount": 2})
+
+    record = cs.PodRecord.from_dict(raw)
+
+    assert record.name == "a"
+    assert record.namespace == "kube-system"
+    assert record.phase == "Running"
+    assert record.ready is False
+    assert record.restart_count == 5
+    assert record.creation_timestamp.year == 2024
+
+
+def test_pod_record_from_dict_without_container_statuses():
+    record = cs.PodRecord.from_dict({"metadata": {"name": "pending"}, "status": {"phase": "Pending"}})
+
+    assert record.ready is False
+    assert record.restart_count == 0
+    assert record.creation_timestamp is None
+
+
+# Backoff
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(cs.time, "sleep", recorded.append)
+    monkeypatch.setattr(cs.random, "uniform", lambda a, b: 0.5)
+    return recorded
+
+
+def test_call_with_backoff_honours_retry_after(sleeps):
+    responses = [api_exception(429, {"Retry-After": "7"}), "ok"]
+
+    def fn(**kwargs):
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert cs._call_with_backoff(fn) == "ok"
+    assert sleeps == [7]
+
+
+def test_call_with_backoff_uses_exponential_backoff_with_jitter(sleeps):
+    calls = []
+
+    def fn(**kwargs):
+        calls.append(kwargs)
+        raise api_exception(503)
+
+    with pytest.raises(ApiException):
+        cs._call_with_backoff(fn)
+
+    assert len(calls) == settings.K8S_API_MAX_RETRIES + 1
+    assert sleeps == [1.5, 2.5, 4.5][:settings.K8S_API_MAX_RETRIES]
+    assert calls[0]["_request_timeout"] == settings.K8S_REQUEST_TIMEOUT_SECONDS
+
+
+def test_call_with_backoff_does_not_retry_client_errors(sleeps):
+    calls = []
+
+    def fn(**kwargs):
+        calls.append(kwargs)
+        raise api_exception(404)
+
+    with pytest.raises(ApiException):
+        cs._call_with_backoff(fn)
+
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+# Table API
+
+def test_list_table_rows_maps_cells_to_column_names():
+    table = {
+        "kind": "Table",
+        "columnDefinitions": [{"name": "Name"}, {"name": "Available"}, {"name": "Degraded"}],
+        "rows": [{"cells": ["etcd", "True", "False"]}, {"cells": ["dns", "False", "True"]}],
+    }
+    calls = []
+
+    class FakeApiClient:
+        def call_api(self, **kwargs):
+            calls.append(kwargs)
+            return FakeResponse(table)
+
+    rows = cs._list_table_rows(FakeApiClient(), "/apis/config.openshift.io/v1/clusteroperators")
+
+    assert rows == [
+        {"Name": "etcd", "Available": "True", "Degraded": "False"},
+        {"Name": "dns", "Available": "False", "Degraded": "True"},
+    ]
+    assert calls[0]["header_params"]["Accept"] == cs.TABLE_ACCEPT
+    assert ("includeObject", "None") in calls[0]["query_params"]
+
+
+# Control-plane pod watcher
+
+class FakeCoreV1:
+    def __init__(self, lists):
+        self.lists = list(lists)
+        self.list_calls = 0
+
+    def list_pod_for_all_namespaces(self, **kwargs):
+        self.list_calls += 1
+        return self.lists.pop(0)
+
+
+def make_fake_watch(watcher, streams):
+    """Watch stand-in replaying one scripted stream per call; stops the watcher at the end."""
+    streams = list(streams)
+
+    class FakeWatch:
+        def stream(self, func, **kwargs):
+            script = streams.pop(0)
+            if isinstance(script, Exception):
+                raise script
+            for position, event in enumerate(script):
+                if not streams and position == len(script) - 1:
+                    watcher.stop()
+                yield event
+
+        def stop(self):
+            pass
+
+    return FakeWatch
+
+
+def test_watcher_applies_added_modified_and_deleted_events(monkeypatch):
+    v1 = FakeCoreV1([pod_list([pod_model("etcd-a", ready=False), pod_model("etcd-c")])])
+    watcher = cs.ControlPlanePodWatcher(v1, "app=etcd")
+    watcher._relist()
+    monkeypatch.setattr(cs.watch, "Watch", make_fake_watch(watcher, [[
+        {"type": "ADDED", "object": pod_model("etcd-b", resource_version="11")},
+        {"type": "MODIFIED", "object": pod_model("etcd-a", ready=True, resource_version="12")},
+        {"type": "DELETED", "object": pod_model("etcd-c", resource_version="13")},
+    ]]))
+
+    watcher._run()
+
+    pods = {record.name: record for record in watcher.snapshot()}
+    assert set(pods) == {"etcd-a", "etcd-b"}
+    assert pods["etcd-a"].ready is True
+    assert watcher._resource_version == "13"
+    assert watcher.seconds_since_sync() is not None
+
+
+def test_watcher_ignores_pods_outside_control_plane_namespaces(monkeypatch):
+    v1 = FakeCoreV1([pod_list([])])
+    watcher = cs.ControlPlanePodWatcher(v1, "tier=control-plane")
+    watcher._relist()
+    monkeypatch.setattr(cs.watch, "Watch", make_fake_watch(watcher, [[
+        {"type": "ADDED", "object": pod_model("etcd-x", namespace="default", resource_version="11")},
+    ]]))
+
+    watcher._run()
+
+    assert watcher.snapshot() == []
+
+
+def test_watcher_relists_after_410_gone(monkeypatch):
+    v1 = FakeCoreV1([
+        pod_list([pod_model("etcd-old")], resource_version="10"),
+        pod_list([pod_model("etcd-new")], resource_version="50"),
+    ])
+    watcher = cs.ControlPlanePodWatcher(v1, "app=etcd")
+    watcher._relist()
+    monkeypatch.setattr(cs.watch, "Watch", make_fake_watch(watcher, [
+        api_exception(410),
+        [{"type": "MODIFIED", "object": pod_model("etcd-new", resource_version="51")}],
+    ]))
+
+    watcher._run()
+
+    assert v1.list_calls == 2
+    assert [record.name for record in watcher.snapshot()] == ["etcd-new"]
+    assert watcher._resource_version == "51"
+
+
+@pytest.mark.asyncio
+async def test_control_plane_pods_flagged_stale(monkeypatch):
+    service = cs.ClusterService()
+
+    class StaleWatcher:
+        def snapshot(self):
+            return [cs.PodRecord("etcd-a", "openshift-etcd", "Running", True, 0, None)]
+
+        def seconds_since_sync(self):
+            return settings.CONTROL_PLANE_CACHE_MAX_AGE_SECONDS + 1
+
+    cluster_client = {"watch_lock": asyncio.Lock(), "control_plane_watcher": StaleWatcher()}
+
+    result = await service.get_control_plane_pods(cluster_client)
+
+    assert result["stale"] is True
+    assert [pod["name"] for pod in result["pods"]] == ["etcd-a"]
+
+
+# Health report
+
+def stub_health_checks(monkeypatch, service, delays):
+    results = {
+        "get_nodes": [{"name": "node-a"}],
+        "get_pods_by_namespace": [{"name": "pod-a"}],
+        "get_control_plane_pods": {"pods": [], "stale": False, "synced_seconds_ago": 1.0},
+        "get_namespaces": [{"name": "default"}],
+        "get_cluster_operators": [],
+        "get_api_server_health": {**service._empty_api_status(), "total_servers": 1, "healthy_servers": 1},
+    }
+    for method, result in results.items():
+        async def check(cluster_client, delay=delays.get(method, 0), result=result):
+            await asyncio.sleep(delay)
+            return result
+        monkeypatch.setattr(service, method, check)
+
+
+@pytest.mark.asyncio
+async def test_health_report_runs_checks_concurrently(monkeypatch):
+    service = cs.ClusterService()
+    stub_health_checks(monkeypatch, service, {method: 0.2 for method in (
+        "get_nodes", "get_pods_by_namespace", "get_control_plane_pods",
+        "get_namespaces", "get_cluster_operators", "get_api_server_health",
+    )})
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    report = await service.get_health_report({"cluster_type": "kubernetes"})
+
+    assert loop.time() - started < 0.6
+    assert report["nodes"] == [{"name": "node-a"}]
+    assert report["api_servers"]["healthy_servers"] == 1
+    assert report["degraded_checks"] == []
+
+
+@pytest.mark.asyncio
+async def test_health_report_times_out_slow_checks_with_empty_values(monkeypatch):
+    service = cs.ClusterService()
+    monkeypatch.setattr(settings, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.05)
+    stub_health_checks(monkeypatch, service, {"get_nodes": 1, "get_api_server_health": 1})
+
+    report = await service.get_health_report({"cluster_type": "kubernetes"})
+
+    assert sorted(report["degraded_checks"]) == ["api_servers", "nodes"]
+    assert report["nodes"] == []
+    assert report["api_servers"] == service._empty_api_status()
+    assert report["pods"] == [{"name": "pod-a"}]
+
+
+# API server probes
+
+def probe_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code, expected", [
+    (200, "ready"),
+    (401, "unknown"),
+    (403, "unknown"),
+    (500, "not_ready"),
+    (503, "not_ready"),
+])
+async def test_probe_readyz_maps_status_codes(status_code, expected):
+    service = cs.ClusterService()
+    async with probe_client(lambda request: httpx.Response(status_code)) as http_client:
+        result = await service._probe_readyz(http_client, "https://10.0.0.1:6443/readyz")
+
+    assert result == {"endpoint": "https://10.0.0.1:6443/readyz", "status": expected, "status_code": status_code}
+
+
+def raise_error(error):
+    def handler(request):
+        raise error
+    return handler
+
+
+def tls_error():
+    try:
+        try:
+            raise ssl.SSLCertVerificationError("certificate verify failed")
+        except ssl.SSLError as cause:
+            raise httpx.ConnectError("certificate verify failed") from cause
+    except httpx.ConnectError as error:
+        return error
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error, expected", [
+    (httpx.ConnectError("connection refused"), "unreachable"),
+    (httpx.ConnectTimeout("timed out"), "unreachable"),
+    (httpx.ReadTimeout("timed out"), "not_ready"),
+    (tls_error(), "unknown"),
+])
+async def test_probe_readyz_maps_transport_errors(error, expected):
+    service = cs.ClusterService()
+    async with probe_client(raise_error(error)) as http_client:
+        result = await service._probe_readyz(http_client, "https://10.0.0.1:6443/readyz")
+
+    assert result["status"] == expected
+    assert result["error"]
+
+
+@pytest.mark.asyncio
+async def test_api_server_health_sends_bearer_token(monkeypatch):
+    service = cs.ClusterService()
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("Authorization"))
+        return httpx.Response(200 if request.url.host == "10.0.0.1" else 500)
+
+    real_async_client = httpx.AsyncClient
+
+    def async_client(**kwargs):
+        return real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(cs.httpx, "AsyncClient", async_client)
+
+    class FakeEndpointsV1:
+        def read_namespaced_endpoints(self, name, namespace, **kwargs):
+            return client.V1Endpoints(subsets=[client.V1EndpointSubset(
+                addresses=[client.V1EndpointAddress(ip="10.0.0.1"), client.V1EndpointAddress(ip="10.0.0.2")],
+                ports=[client.CoreV1EndpointPort(port=6443)],
+            )])
+
+    configuration = client.Configuration()
+    configuration.verify_ssl = False
+    configuration.api_key = {"authorization": "Bearer secret"}
+    cluster_client = {"v1": FakeEndpointsV1(), "api_client": client.ApiClient(configuration)}
+
+    result = await service.get_api_server_health(cluster_client)
+
+    assert seen == ["Bearer secret", "Bearer secret"]
+    assert result["total_servers"] == 2
+    assert result["healthy_servers"] == 1
+    assert result["unhealthy_servers"] == 1